@@ -7,17 +7,76 @@ Users can either select from predefined popular locations or input custom coordi
 The script includes deduplication and exports results to Excel with multiple sheets.
 """
 
+import argparse
 import json
+import math
+import os
+import shutil
+import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import time
+import numpy as np
 import pandas as pd
+import xlsxwriter
 from datetime import datetime
 from typing import List, Dict, Optional, Set, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from operator import attrgetter, itemgetter
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# orjson decodes API responses considerably faster; fall back to the standard library
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
-@dataclass
+# pyarrow enables per-area Parquet checkpoints; crawls are not resumable without it
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+
+# Number of coordinate points crawled at the same time. The crawl is network-bound,
+# so the pool only overlaps request latency; the shared RateLimiter below caps
+# how hard the API is actually hit.
+MAX_CONCURRENT_LOCATIONS = 8
+
+# Per-area results are saved here so an interrupted crawl can resume
+CHECKPOINT_DIR = 'crawl_checkpoints'
+
+# API request budget shared by all workers (token bucket)
+REQUESTS_PER_SECOND = 5.0
+REQUEST_BURST = 10
+
+# Hong Kong approximate boundaries used for coordinate validation
+MIN_LONGITUDE, MAX_LONGITUDE = 113.8, 114.5
+MIN_LATITUDE, MAX_LATITUDE = 22.0, 22.6
+
+# Separator for coordinate input: commas and/or whitespace
+COORDINATE_SEPARATOR = re.compile(r'[,\s]+')
+
+# Top-level API item fields and the value used when a key is missing
+ITEM_FIELD_DEFAULTS = {
+    'code': '', 'name': '', 'rating': None, 'review_number': None,
+    'longitude': None, 'latitude': None, 'distance': None, 'minimum_order_amount': None,
+    'address': '', 'address_line2': None, 'customer_phone': '', 'budget': None,
+    'delivery_provider': None, 'hero_image': None, 'website': None, 'is_active': True,
+}
+get_item_fields = itemgetter(*ITEM_FIELD_DEFAULTS)
+
+# Slotted dataclasses (no per-instance __dict__) are only available on Python 3.10+
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Restaurant:
     """Restaurant data structure - contains all restaurant information fields"""
     code: str                           # Unique restaurant identifier
@@ -47,6 +106,20 @@ class Restaurant:
     tags: str = ""                            # Restaurant tags (comma-separated)
 
 
+# Restaurant Data sheet columns, ordered for readability
+COLUMN_ORDER = [
+    'name', 'area', 'code', 'rating', 'rating_count', 'cuisines',
+    'address', 'phone', 'longitude', 'latitude', 'distance',
+    'minimum_order', 'budget_range', 'chain_name', 'legal_name',
+    'is_open', 'is_delivery_enabled', 'is_pickup_enabled',
+    'delivery_provider', 'available_in', 'tags',
+    'hero_image', 'website'
+]
+
+# Restaurant field names in declaration order
+RESTAURANT_FIELDS = [field.name for field in fields(Restaurant)]
+
+
 def validate_coordinates(longitude: float, latitude: float) -> bool:
     """
     Validate if coordinates are within Hong Kong boundaries
@@ -58,15 +131,29 @@ def validate_coordinates(longitude: float, latitude: float) -> bool:
     Returns:
         bool: True if coordinates are within HK bounds, False otherwise
     """
-    # Hong Kong approximate boundaries
-    # Longitude: 113.8 - 114.5
-    # Latitude: 22.0 - 22.6
-    if 113.8 <= longitude <= 114.5 and 22.0 <= latitude <= 22.6:
+    if MIN_LONGITUDE <= longitude <= MAX_LONGITUDE and MIN_LATITUDE <= latitude <= MAX_LATITUDE:
         return True
     return False
 
 
-def parse_coordinate_input(coord_input: str) -> Optional[Tuple[float, float, str]]:
+def validate_coordinates_batch(longitudes, latitudes) -> np.ndarray:
+    """
+    Validate many coordinates against Hong Kong boundaries in one vectorized pass
+    
+    Args:
+        longitudes: Sequence or array of GPS longitude coordinates
+        latitudes: Sequence or array of GPS latitude coordinates
+        
+    Returns:
+        np.ndarray: Boolean mask, True where the coordinate pair is within HK bounds
+    """
+    longitudes = np.asarray(longitudes, dtype=float)
+    latitudes = np.asarray(latitudes, dtype=float)
+    return ((MIN_LONGITUDE <= longitudes) & (longitudes <= MAX_LONGITUDE) &
+            (MIN_LATITUDE <= latitudes) & (latitudes <= MAX_LATITUDE))
+
+
+def parse_coordinate_input(coord_input: str, validate: bool = True) -> Optional[Tuple[float, float, str]]:
     """
     Parse coordinate input string, supports multiple formats:
     - "114.1578,22.2842,Central"
@@ -75,19 +162,15 @@ def parse_coordinate_input(coord_input: str) -> Optional[Tuple[float, float, str
     
     Args:
         coord_input: String containing coordinates and optional area name
+        validate: Check the coordinates against HK bounds (disable when the
+                  caller validates a whole batch with validate_coordinates_batch)
         
     Returns:
         Optional[Tuple[float, float, str]]: (longitude, latitude, area_name) or None if invalid
     """
     try:
-        # Remove extra whitespace
-        coord_input = coord_input.strip()
-        
-        # Try to split (supports comma or space separation)
-        if ',' in coord_input:
-            parts = [part.strip() for part in coord_input.split(',')]
-        else:
-            parts = coord_input.split()
+        # Split on commas and/or whitespace in one pass
+        parts = COORDINATE_SEPARATOR.split(coord_input.strip())
         
         if len(parts) < 2:
             return None
@@ -100,13 +183,13 @@ def parse_coordinate_input(coord_input: str) -> Optional[Tuple[float, float, str
             return None
         
         # Validate coordinate range
-        if not validate_coordinates(longitude, latitude):
+        if validate and not validate_coordinates(longitude, latitude):
             return None
         
         # Parse area name (if provided)
         area_name = "Custom Location"
         if len(parts) > 2:
-            area_name = ' '.join(parts[2:]).strip()
+            area_name = ' '.join(parts[2:])
         
         return (longitude, latitude, area_name)
         
@@ -114,6 +197,55 @@ def parse_coordinate_input(coord_input: str) -> Optional[Tuple[float, float, str
         return None
 
 
+def join_entry_names(entries, key: str) -> str:
+    """
+    Join the non-empty names of a list of API entries (cuisines, tags)
+    
+    Args:
+        entries: List of dictionaries from the API response (may be None)
+        key: Dictionary key holding the display name
+        
+    Returns:
+        str: Comma-separated names, or empty string if there are none
+    """
+    names = []
+    try:
+        for entry in entries or ():
+            entry_name = (entry.get(key) or '').strip()
+            if entry_name:
+                names.append(entry_name)
+    except AttributeError:
+        # Some entries are not dictionaries or have a non-string name;
+        # skip those and keep the rest
+        names = []
+        for entry in entries:
+            entry_name = entry.get(key) if isinstance(entry, dict) else None
+            if isinstance(entry_name, str):
+                entry_name = entry_name.strip()
+                if entry_name:
+                    names.append(entry_name)
+    return ', '.join(names)
+
+
+def read_item_fields(item: Dict) -> Tuple:
+    """
+    Read all top-level fields of an API item in ITEM_FIELD_DEFAULTS order
+    
+    Uses a single itemgetter call when every key is present and falls back to
+    per-key lookups with defaults otherwise.
+    
+    Args:
+        item: Restaurant data dictionary from API
+        
+    Returns:
+        Tuple: Field values in ITEM_FIELD_DEFAULTS order
+    """
+    try:
+        return get_item_fields(item)
+    except KeyError:
+        return tuple(item.get(key, default) for key, default in ITEM_FIELD_DEFAULTS.items())
+
+
 def parse_restaurant_data(item: Dict, area_name: str) -> Optional[Restaurant]:
     """
     Parse individual restaurant data from API response
@@ -123,146 +255,141 @@ def parse_restaurant_data(item: Dict, area_name: str) -> Optional[Restaurant]:
         area_name: Name of the search area
         
     Returns:
-        Optional[Restaurant]: Restaurant object or None if parsing fails
+        Optional[Restaurant]: Restaurant object or None if the code or name is missing
     """
-    try:
-        # Basic identifiers - skip if missing
-        code = item.get('code', '')
-        name = item.get('name', '')
-        if not code or not name:
-            return None
-
-        # Rating information
-        rating = item.get('rating')
-        rating_count = item.get('review_number')
-
-        # Location data
-        longitude = item.get('longitude')
-        latitude = item.get('latitude')
-        distance = item.get('distance')
-
-        # Order information
-        minimum_order = item.get('minimum_order_amount')
-        
-        # Get availability info from metadata
-        metadata = item.get('metadata', {})
-        available_in = metadata.get('available_in')
-        is_delivery_available = metadata.get('is_delivery_available', True)
-        is_pickup_available = metadata.get('is_pickup_available', True)
-        
-        # Address information
-        address = item.get('address', '')
-        if item.get('address_line2'):
-            address += f", {item.get('address_line2')}"
-        
-        # Contact and basic info
-        phone = item.get('customer_phone', '')
-        budget_range = item.get('budget')
-        
-        # Chain information
-        chain_name = None
-        chain_data = item.get('chain')
-        if chain_data and isinstance(chain_data, dict):
-            chain_name = chain_data.get('name')
-
-        # Parse cuisine types
-        cuisines_list = []
-        characteristics = item.get('characteristics', {})
-        if 'cuisines' in characteristics:
-            for cuisine in characteristics['cuisines']:
-                if isinstance(cuisine, dict):
-                    cuisine_name = cuisine.get('name', '').strip()
-                    if cuisine_name:
-                        cuisines_list.append(cuisine_name)
-        
-        # Fallback to direct cuisines field
-        if not cuisines_list and 'cuisines' in item:
-            for cuisine in item['cuisines']:
-                if isinstance(cuisine, dict):
-                    cuisine_name = cuisine.get('name', '').strip()
-                    if cuisine_name:
-                        cuisines_list.append(cuisine_name)
-        
-        cuisines_str = ', '.join(cuisines_list)
-
-        # Parse tags information
-        tags_list = []
-        if 'tags' in item and isinstance(item['tags'], list):
-            for tag in item['tags']:
-                if isinstance(tag, dict):
-                    tag_text = tag.get('text', '').strip()
-                    if tag_text:
-                        tags_list.append(tag_text)
-        tags_str = ', '.join(tags_list)
-
-        # Additional information
-        delivery_provider = item.get('delivery_provider')
-        hero_image = item.get('hero_image')
-        website = item.get('website')
-        
-        # Legal name information
-        legal_name = None
-        vendor_legal = item.get('vendor_legal_information', {})
-        if vendor_legal:
-            legal_name = vendor_legal.get('legal_name')
-
-        # Operating status
-        is_open = item.get('is_active', True) and not metadata.get('is_temporary_closed', False)
-
-        # Create Restaurant object with all parsed data
-        restaurant = Restaurant(
-            code=code,
-            name=name,
-            rating=rating,
-            rating_count=rating_count,
-            delivery_time=None,
-            minimum_order=minimum_order,
-            delivery_fee=None,
-            address=address,
-            phone=phone,
-            is_open=is_open,
-            cuisines=cuisines_str,
-            budget_range=budget_range,
-            chain_name=chain_name,
-            longitude=longitude,
-            latitude=latitude,
-            area=area_name,
-            distance=distance,
-            is_delivery_enabled=is_delivery_available,
-            is_pickup_enabled=is_pickup_available,
-            delivery_provider=delivery_provider,
-            hero_image=hero_image,
-            website=website,
-            legal_name=legal_name,
-            available_in=available_in,
-            tags=tags_str
-        )
-        
-        return restaurant
+    (code, name, rating, rating_count, longitude, latitude, distance, minimum_order,
+     address, address_line2, phone, budget_range, delivery_provider, hero_image, website,
+     is_active) = read_item_fields(item)
     
-    except Exception as e:
-        print(f"⚠️  Error parsing restaurant data ({item.get('name', 'Unknown')}): {e}")
+    # Basic identifiers - skip if missing
+    if not code or not name:
         return None
 
+    # Resolve nested sections once
+    metadata = item.get('metadata') or {}
+    characteristics = item.get('characteristics') or {}
+    chain_data = item.get('chain')
+    vendor_legal = item.get('vendor_legal_information') or {}
+    
+    # Availability info from metadata
+    available_in = metadata.get('available_in')
+    is_delivery_available = metadata.get('is_delivery_available', True)
+    is_pickup_available = metadata.get('is_pickup_available', True)
+    
+    # Address information
+    if address_line2:
+        address = f"{address or ''}, {address_line2}"
+    
+    # Chain information
+    chain_name = chain_data.get('name') if isinstance(chain_data, dict) else None
+    
+    # Cuisine types, falling back to the direct cuisines field
+    cuisines_str = (join_entry_names(characteristics.get('cuisines'), 'name') or
+                    join_entry_names(item.get('cuisines'), 'name'))
+    
+    # Tags information
+    tags_str = join_entry_names(item.get('tags'), 'text')
+    
+    # Operating status
+    is_open = is_active and not metadata.get('is_temporary_closed', False)
+
+    # Create Restaurant object with all parsed data
+    return Restaurant(
+        code=code,
+        name=name,
+        rating=rating,
+        rating_count=rating_count,
+        delivery_time=None,
+        minimum_order=minimum_order,
+        delivery_fee=None,
+        address=address,
+        phone=phone,
+        is_open=is_open,
+        cuisines=cuisines_str,
+        budget_range=budget_range,
+        chain_name=chain_name,
+        longitude=longitude,
+        latitude=latitude,
+        area=area_name,
+        distance=distance,
+        is_delivery_enabled=is_delivery_available,
+        is_pickup_enabled=is_pickup_available,
+        delivery_provider=delivery_provider,
+        hero_image=hero_image,
+        website=website,
+        legal_name=vendor_legal.get('legal_name'),
+        available_in=available_in,
+        tags=tags_str
+    )
+
 
-def get_restaurants_by_location(longitude: float, latitude: float, area_name: str, limit: int = 200) -> List[Restaurant]:
+class RateLimiter:
     """
-    Fetch restaurant data from a specific location using FoodPanda API
+    Thread-safe token bucket shared by all crawler workers
+    
+    Requests go out immediately while the bucket has tokens and are spaced at
+    `rate` per second once it is empty. Rate limit headers returned by the API
+    (Retry-After, X-RateLimit-Remaining) pause every worker as long as required.
+    """
+    
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, burst: int = REQUEST_BURST):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until the next request may be sent"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            
+            # Reserve a token; a negative balance is the queue of waiting requests
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self.blocked_until - now)
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def update_from_headers(self, headers) -> None:
+        """
+        Adjust the budget using rate limit headers from an API response
+        
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        retry_after = headers.get('Retry-After')
+        remaining = headers.get('X-RateLimit-Remaining')
+        
+        with self.lock:
+            if retry_after:
+                try:
+                    self.blocked_until = max(self.blocked_until, time.monotonic() + float(retry_after))
+                except ValueError:
+                    pass  # HTTP-date form, urllib3's Retry already honours it
+            if remaining is not None and remaining.strip() == '0':
+                self.tokens = min(self.tokens, 0.0)
+
+
+def create_session(pool_size: int = MAX_CONCURRENT_LOCATIONS) -> requests.Session:
+    """
+    Create an HTTP session for the FoodPanda API
+    
+    The session keeps connections alive between requests and coordinate points,
+    and retries transient failures (rate limiting, gateway errors) with backoff.
     
     Args:
-        longitude: GPS longitude coordinate
-        latitude: GPS latitude coordinate  
-        area_name: Name of the search area for identification
-        limit: Maximum number of restaurants to fetch
+        pool_size: Number of connections kept open, should match the number of worker threads
         
     Returns:
-        List[Restaurant]: List of restaurant objects from this location
+        requests.Session: Configured session with browser-like headers
     """
-    # FoodPanda API endpoint for restaurant listing
-    url = 'https://disco.deliveryhero.io/listing/api/v1/pandora/vendors'
-    
-    # Setup HTTP session with browser-like headers to avoid detection
     session = requests.Session()
+    
+    # Browser-like headers to avoid detection
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'application/json, text/plain, */*',
@@ -272,9 +399,45 @@ def get_restaurants_by_location(longitude: float, latitude: float, area_name: st
         'Origin': 'https://www.foodpanda.hk',
     })
     
+    # Retry transient errors; the final response is still returned so callers can check the status
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    
+    return session
+
+
+def fetch_location_restaurants(longitude: float, latitude: float, area_name: str, limit: int = 200,
+                               session: Optional[requests.Session] = None,
+                               rate_limiter: Optional[RateLimiter] = None) -> Tuple[List[Restaurant], bool]:
+    """
+    Fetch restaurant data from a specific location and report whether pagination finished
+    
+    Args:
+        longitude: GPS longitude coordinate
+        latitude: GPS latitude coordinate  
+        area_name: Name of the search area for identification
+        limit: Maximum number of restaurants to fetch
+        session: Shared HTTP session from create_session(), a new one is created if omitted
+        rate_limiter: Shared RateLimiter, a new one is created if omitted
+        
+    Returns:
+        Tuple[List[Restaurant], bool]: Restaurants from this location, and False if a failed
+        request or unexpected response cut the pagination short
+    """
+    # FoodPanda API endpoint for restaurant listing
+    url = 'https://disco.deliveryhero.io/listing/api/v1/pandora/vendors'
+    
+    # Reuse the caller's session (and its open connections) when given one
+    if session is None:
+        session = create_session()
+    if rate_limiter is None:
+        rate_limiter = RateLimiter()
+    
     restaurants = []
     offset = 0          # Pagination offset
     batch_size = 48     # Number of restaurants per request
+    completed = True    # Cleared when a request fails before the last page
     
     print(f"🔍 Collecting restaurant data for {area_name} ({longitude:.4f}, {latitude:.4f})...")
     
@@ -298,28 +461,41 @@ def get_restaurants_by_location(longitude: float, latitude: float, area_name: st
         }
         
         try:
-            # Make API request with timeout
+            # Make API request with timeout once the rate limiter allows it
+            rate_limiter.acquire()
             response = session.get(url, params=params, timeout=15)
+            rate_limiter.update_from_headers(response.headers)
             
             # Check for successful response
             if response.status_code != 200:
                 print(f"❌ API request failed (Status: {response.status_code})")
+                completed = False
                 break
             
-            data = response.json()
+            data = json_loads(response.content)
             
             # Validate response structure
             if not data or 'data' not in data or 'items' not in data['data']:
+                completed = False
                 break
                 
             items = data['data']['items']
             if not items:  # No more restaurants available
                 break
             
+            # A short page means the API has no more restaurants for this location
+            last_page = len(items) < params['limit']
+            
             # Parse restaurant data from this batch
             batch_restaurants = []
             for item in items:
-                restaurant = parse_restaurant_data(item, area_name)
+                try:
+                    restaurant = parse_restaurant_data(item, area_name)
+                except Exception as e:
+                    # Skip a malformed item rather than the rest of the area
+                    item_name = item.get('name', 'Unknown') if isinstance(item, dict) else 'Unknown'
+                    print(f"⚠️  Error parsing restaurant data ({item_name}): {e}")
+                    continue
                 if restaurant:
                     batch_restaurants.append(restaurant)
             
@@ -329,21 +505,231 @@ def get_restaurants_by_location(longitude: float, latitude: float, area_name: st
             
             print(f"📥 {area_name}: Collected {len(restaurants)} restaurants (this batch: {len(batch_restaurants)})")
             
-            # Stop if no new restaurants found
-            if len(batch_restaurants) == 0:
+            # Stop if no new restaurants found or nothing is left to fetch
+            if len(batch_restaurants) == 0 or last_page or len(restaurants) >= limit:
                 break
             
-            # Rate limiting to avoid being blocked
-            time.sleep(1.0)
-            
         except Exception as e:
             print(f"❌ Error occurred for {area_name}: {e}")
+            completed = False
             break
     
     print(f"✅ {area_name}: Collection completed, total {len(restaurants)} restaurants")
+    return restaurants, completed
+
+
+def get_restaurants_by_location(longitude: float, latitude: float, area_name: str, limit: int = 200,
+                                session: Optional[requests.Session] = None,
+                                rate_limiter: Optional[RateLimiter] = None) -> List[Restaurant]:
+    """
+    Fetch restaurant data from a specific location using FoodPanda API
+    
+    Args:
+        longitude: GPS longitude coordinate
+        latitude: GPS latitude coordinate  
+        area_name: Name of the search area for identification
+        limit: Maximum number of restaurants to fetch
+        session: Shared HTTP session from create_session(), a new one is created if omitted
+        rate_limiter: Shared RateLimiter, a new one is created if omitted
+        
+    Returns:
+        List[Restaurant]: List of restaurant objects from this location
+    """
+    restaurants, _ = fetch_location_restaurants(longitude, latitude, area_name, limit, session, rate_limiter)
+    return restaurants
+
+
+def get_checkpoint_path(longitude: float, latitude: float, area_name: str,
+                        checkpoint_dir: str = CHECKPOINT_DIR) -> str:
+    """
+    Get the checkpoint file path for a coordinate point
+    
+    The exact coordinates are used in the name, so nearby custom points that
+    share an area name never share a checkpoint file.
+    
+    Args:
+        longitude: GPS longitude coordinate
+        latitude: GPS latitude coordinate
+        area_name: Name of the search area
+        checkpoint_dir: Directory holding the checkpoint files
+        
+    Returns:
+        str: Path of the Parquet checkpoint file for this coordinate point
+    """
+    safe_name = re.sub(r'[^\w.-]+', '_', area_name).strip('_')
+    return os.path.join(checkpoint_dir, f"{longitude!r}_{latitude!r}_{safe_name}.parquet")
+
+
+def save_area_checkpoint(restaurants: List[Restaurant], checkpoint_path: str) -> None:
+    """
+    Save one area's restaurants to a Parquet checkpoint file
+    
+    The file is written under a temporary name and then renamed, so an
+    interrupted write never leaves a partial checkpoint behind.
+    
+    Args:
+        restaurants: Restaurants collected for the area
+        checkpoint_path: Destination from get_checkpoint_path()
+    """
+    if pq is None or not restaurants:
+        return
+    
+    os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+    table = pa.table({
+        field_name: [getattr(restaurant, field_name) for restaurant in restaurants]
+        for field_name in RESTAURANT_FIELDS
+    })
+    temp_path = checkpoint_path + '.tmp'
+    pq.write_table(table, temp_path)
+    os.replace(temp_path, checkpoint_path)
+
+
+def load_area_checkpoint(checkpoint_path: str) -> Optional[List[Restaurant]]:
+    """
+    Load one area's restaurants from a Parquet checkpoint file
+    
+    Args:
+        checkpoint_path: Path from get_checkpoint_path()
+        
+    Returns:
+        Optional[List[Restaurant]]: Saved restaurants, or None if there is no usable checkpoint
+    """
+    if pq is None or not os.path.exists(checkpoint_path):
+        return None
+    
+    try:
+        table = pq.read_table(checkpoint_path)
+        
+        # A checkpoint written before the Restaurant fields changed cannot be reused
+        if set(table.column_names) != set(RESTAURANT_FIELDS):
+            print(f"⚠️  Ignoring checkpoint {checkpoint_path}: columns do not match the Restaurant fields")
+            return None
+        
+        return [Restaurant(**row) for row in table.to_pylist()]
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable checkpoint {checkpoint_path}: {e}")
+        return None
+
+
+def clear_checkpoints(checkpoint_dir: str = CHECKPOINT_DIR) -> None:
+    """
+    Remove all checkpoint files once their results have been exported
+    
+    Args:
+        checkpoint_dir: Directory holding the checkpoint files
+    """
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
+
+
+def crawl_area(longitude: float, latitude: float, area_name: str, limit: int,
+               session: requests.Session, rate_limiter: RateLimiter,
+               checkpoint_dir: str = CHECKPOINT_DIR) -> List[Restaurant]:
+    """
+    Fetch one coordinate point, reusing its checkpoint from an interrupted run if present
+    
+    Args:
+        longitude: GPS longitude coordinate
+        latitude: GPS latitude coordinate
+        area_name: Name of the search area
+        limit: Maximum number of restaurants to fetch
+        session: Shared HTTP session
+        rate_limiter: Shared RateLimiter
+        checkpoint_dir: Directory holding the checkpoint files
+        
+    Returns:
+        List[Restaurant]: Restaurants for this coordinate point
+    """
+    checkpoint_path = get_checkpoint_path(longitude, latitude, area_name, checkpoint_dir)
+    
+    restaurants = load_area_checkpoint(checkpoint_path)
+    if restaurants is not None:
+        saved_at = datetime.fromtimestamp(os.path.getmtime(checkpoint_path)).strftime('%Y-%m-%d %H:%M:%S')
+        print(f"♻️  {area_name}: Loaded {len(restaurants)} restaurants from checkpoint saved {saved_at}")
+        return restaurants
+    
+    restaurants, completed = fetch_location_restaurants(longitude, latitude, area_name, limit,
+                                                        session, rate_limiter)
+    
+    # Only checkpoint finished areas; a truncated one is fetched again on resume
+    if not completed:
+        return restaurants
+    
+    try:
+        save_area_checkpoint(restaurants, checkpoint_path)
+    except Exception as e:
+        # The fetched data is still good even if it could not be checkpointed
+        print(f"⚠️  {area_name}: Could not save checkpoint: {e}")
     return restaurants
 
 
+def crawl_coordinates(coordinates: List[Tuple[float, float, str]], limit: int = 150,
+                      max_workers: int = MAX_CONCURRENT_LOCATIONS,
+                      checkpoint_dir: str = CHECKPOINT_DIR) -> List[Restaurant]:
+    """
+    Fetch restaurant data for several coordinate points concurrently
+    
+    Each coordinate point is crawled in its own worker thread so that network
+    round trips overlap instead of running back to back. Progress is reported as
+    soon as each coordinate point finishes, but results are merged in the same
+    order as the input coordinates. Each finished coordinate point is
+    checkpointed, so re-running after an interruption only fetches the rest.
+    
+    Args:
+        coordinates: List of (longitude, latitude, area_name) tuples
+        limit: Maximum number of restaurants to fetch per coordinate point
+        max_workers: Maximum number of coordinate points crawled at the same time
+        checkpoint_dir: Directory holding the per-area checkpoint files
+        
+    Returns:
+        List[Restaurant]: Combined (not yet deduplicated) restaurant list
+    """
+    all_restaurants = []
+    area_results = {}
+    
+    if pq is None:
+        print("💡 Install pyarrow to make interrupted crawls resumable")
+    
+    # One session and one request budget shared by all workers
+    rate_limiter = RateLimiter()
+    with create_session(pool_size=max_workers) as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(crawl_area, longitude, latitude, area_name, limit,
+                            session, rate_limiter, checkpoint_dir): index
+            for index, (longitude, latitude, area_name) in enumerate(coordinates)
+        }
+        
+        # Report in completion order so one slow area doesn't hide the others
+        fetched_count = 0
+        try:
+            for processed_count, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                area_name = coordinates[index][2]
+                try:
+                    area_restaurants = future.result()
+                except Exception as e:
+                    print(f"❌ Error occurred for {area_name}: {e}")
+                    continue
+                
+                print(f"\n🔄 Progress: {processed_count}/{len(coordinates)} - {area_name}")
+                if area_restaurants:
+                    area_results[index] = area_restaurants
+                    fetched_count += len(area_restaurants)
+                    print(f"📊 Current total: {fetched_count} restaurants (this batch: {len(area_restaurants)})")
+        except KeyboardInterrupt:
+            # Drop queued areas so leaving the executor only waits for the running ones
+            # (cancel_futures needs Python 3.9)
+            print("\n👋 Crawl interrupted, waiting for running areas to stop...")
+            for future in futures:
+                future.cancel()
+            raise
+    
+    # Merge in input order so the output is deterministic
+    for index in sorted(area_results):
+        all_restaurants.extend(area_results[index])
+    
+    return all_restaurants
+
+
 def get_predefined_coordinates():
     """
     Get predefined popular coordinate points in Hong Kong
@@ -394,6 +780,57 @@ def get_predefined_coordinates():
     }
 
 
+def build_location_index(predefined: Dict[str, Tuple[float, float]]) -> Dict[str, str]:
+    """
+    Build a case-insensitive lookup table for predefined location names
+    
+    Each location is reachable by its full name ("Central 中環"), its English
+    part ("central") and its Chinese part ("中環").
+    
+    Args:
+        predefined: Dictionary mapping area names to (longitude, latitude) tuples
+        
+    Returns:
+        Dict[str, str]: Lowercase lookup key -> predefined area name
+    """
+    index = {}
+    for name in predefined:
+        full_key = name.lower()
+        index.setdefault(full_key, name)
+        for part in full_key.rsplit(' ', 1):
+            index.setdefault(part, name)
+    return index
+
+
+def match_predefined_location(loc: str, location_index: Dict[str, str]) -> Optional[str]:
+    """
+    Find the predefined location matching user input
+    
+    Exact names are resolved with a single dictionary lookup; anything else
+    falls back to the first location whose name contains the input.
+    
+    Args:
+        loc: User-entered location name (case-insensitive, may be partial)
+        location_index: Lookup table from build_location_index()
+        
+    Returns:
+        Optional[str]: Matching predefined area name, or None if not found
+    """
+    key = loc.lower().strip()
+    if not key:
+        return None
+    
+    name = location_index.get(key)
+    if name:
+        return name
+    
+    # Partial match, e.g. "Tsim" -> "Tsim Sha Tsui 尖沙咀"
+    for index_key, name in location_index.items():
+        if key in index_key:
+            return name
+    return None
+
+
 def get_user_coordinates():
     """
     Get user-selected coordinates for restaurant search
@@ -404,6 +841,7 @@ def get_user_coordinates():
     """
     
     predefined = get_predefined_coordinates()
+    location_index = build_location_index(predefined)
     
     print("\n" + "="*80)
     print("📍 Select Search Coordinates")
@@ -461,16 +899,12 @@ def get_user_coordinates():
                 valid_locations = []
                 
                 for loc in locations_input:
-                    # Fuzzy matching - match partial names
-                    matched = False
-                    for name, coords in predefined.items():
-                        if loc in name or name.startswith(loc):
-                            selected_coordinates.append((coords[0], coords[1], name))
-                            valid_locations.append(name)
-                            matched = True
-                            break
-                    
-                    if not matched:
+                    name = match_predefined_location(loc, location_index)
+                    if name:
+                        coords = predefined[name]
+                        selected_coordinates.append((coords[0], coords[1], name))
+                        valid_locations.append(name)
+                    else:
                         print(f"⚠️  Could not find '{loc}' in predefined coordinates")
                 
                 if valid_locations:
@@ -495,19 +929,32 @@ def get_user_coordinates():
             try:
                 print(f"\nPlease enter coordinates (one per line, empty line to finish):")
                 custom_coords = []
+                coord_lines = []
+                parsed_lines = []
                 
+                # Parse each line as it is entered so malformed input is reported right away
                 while True:
                     coord_input = input().strip()
                     if not coord_input:
                         break
-                    
-                    parsed = parse_coordinate_input(coord_input)
+                    parsed = parse_coordinate_input(coord_input, validate=False)
                     if parsed:
+                        coord_lines.append(coord_input)
+                        parsed_lines.append(parsed)
+                    else:
+                        print(f"❌ Invalid coordinate format: {coord_input}")
+                
+                # Check the HK bounds of all well-formed lines in one call
+                in_bounds = validate_coordinates_batch([parsed[0] for parsed in parsed_lines],
+                                                       [parsed[1] for parsed in parsed_lines])
+                
+                for coord_input, parsed, inside in zip(coord_lines, parsed_lines, in_bounds):
+                    if inside:
                         longitude, latitude, area_name = parsed
                         custom_coords.append((longitude, latitude, area_name))
                         print(f"✅ Added: {area_name} ({longitude:.4f}, {latitude:.4f})")
                     else:
-                        print(f"❌ Invalid coordinate format: {coord_input}")
+                        print(f"❌ Coordinates outside Hong Kong range: {coord_input}")
                 
                 if custom_coords:
                     selected_coordinates.extend(custom_coords)
@@ -529,6 +976,14 @@ def get_user_coordinates():
         print("❌ No coordinate points selected")
         return []
     
+    # Drop points selected more than once (first name wins), keeping selection order
+    unique_points = {}
+    for coordinate in selected_coordinates:
+        unique_points.setdefault(coordinate[:2], coordinate)
+    if len(unique_points) < len(selected_coordinates):
+        print(f"🔄 Skipping {len(selected_coordinates) - len(unique_points)} repeated coordinate point(s)")
+        selected_coordinates = list(unique_points.values())
+    
     print(f"\n📍 Final selected search coordinates ({len(selected_coordinates)} points):")
     for i, (lng, lat, name) in enumerate(selected_coordinates, 1):
         print(f"  {i:2d}. {name:<30} ({lng:.4f}, {lat:.4f})")
@@ -551,35 +1006,36 @@ def remove_duplicates(restaurants: List[Restaurant]) -> List[Restaurant]:
     
     print(f"🔄 Starting deduplication process, original count: {len(restaurants)}")
     
-    unique_restaurants = []
-    seen_identifiers = set()
+    # Build only the identifier columns needed for hashing
+    keys = pd.DataFrame({
+        'code': [restaurant.code for restaurant in restaurants],
+        'name': [restaurant.name for restaurant in restaurants],
+        'address': [restaurant.address for restaurant in restaurants],
+    }, dtype=object)
     
-    for restaurant in restaurants:
-        # Primary identifier: code (most reliable)
-        primary_id = restaurant.code.lower().strip() if restaurant.code else ""
-        
-        # Secondary identifier: name + address combination
-        secondary_id = None
-        if restaurant.name and restaurant.address:
-            name_clean = restaurant.name.lower().strip()
-            address_clean = restaurant.address.lower().strip()
-            secondary_id = f"{name_clean}|{address_clean}"
-        
-        # Check for duplicates
-        is_duplicate = False
-        
-        if primary_id and primary_id in seen_identifiers:
-            is_duplicate = True
-        elif not primary_id and secondary_id and secondary_id in seen_identifiers:
-            is_duplicate = True
-        
-        if not is_duplicate:
-            unique_restaurants.append(restaurant)
-            
-            if primary_id:
-                seen_identifiers.add(primary_id)
-            if secondary_id:
-                seen_identifiers.add(secondary_id)
+    # Primary identifier: code (most reliable)
+    code_key = keys['code'].fillna('').str.lower().str.strip()
+    has_code = (code_key != '').to_numpy()
+    
+    # Secondary identifier: (name, address) pair, hashed as a tuple so that
+    # separator characters inside either field cannot produce false matches
+    has_secondary = ((keys['name'].fillna('') != '') & (keys['address'].fillna('') != '')).to_numpy()
+    secondary_key = pd.DataFrame({
+        'name': keys['name'].str.lower().str.strip(),
+        'address': keys['address'].str.lower().str.strip(),
+    })
+    
+    # Restaurants with a code are duplicates only of an earlier identical code
+    keep = ~has_code
+    keep[has_code] = ~code_key[has_code].duplicated(keep='first').to_numpy()
+    
+    # Restaurants without a code fall back to name + address, matched against
+    # every earlier kept restaurant (with or without a code)
+    candidates = keep & has_secondary
+    is_repeat = secondary_key[candidates].duplicated(keep='first').reindex(keys.index, fill_value=False).to_numpy()
+    keep &= ~(is_repeat & ~has_code)
+    
+    unique_restaurants = [restaurant for restaurant, kept in zip(restaurants, keep) if kept]
     
     removed_count = len(restaurants) - len(unique_restaurants)
     print(f"✅ Deduplication completed, removed {removed_count} duplicates, remaining: {len(unique_restaurants)} restaurants")
@@ -587,13 +1043,67 @@ def remove_duplicates(restaurants: List[Restaurant]) -> List[Restaurant]:
     return unique_restaurants
 
 
-def export_restaurants_to_excel(all_restaurants: List[Restaurant], custom_name: str = "") -> str:
+def write_sheet_rows(workbook: xlsxwriter.Workbook, sheet_name: str, header: List[str], rows,
+                     header_format=None) -> None:
+    """
+    Write a header and rows to a new worksheet one row at a time
+    
+    Rows must be written in order because the workbook is opened in xlsxwriter's
+    constant_memory mode. None values are written as empty cells.
+    
+    Args:
+        workbook: Open xlsxwriter Workbook
+        sheet_name: Name of the worksheet to create
+        header: Column names for the first row
+        rows: Iterable of row sequences, in the same order as header
+        header_format: Optional cell format for the header row
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, header, header_format)
+    for row_index, row in enumerate(rows, 1):
+        worksheet.write_row(row_index, 0, row)
+
+
+def get_export_filename(custom_name: str, extension: str) -> str:
+    """
+    Build a timestamped output filename
+    
+    Args:
+        custom_name: Custom name to include in filename
+        extension: File extension without the dot (e.g. 'xlsx')
+        
+    Returns:
+        str: Output filename
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"foodpanda_hk_{custom_name or 'coordinates'}_{timestamp}.{extension}"
+
+
+def build_export_columns(restaurants: List[Restaurant]) -> Dict[str, list]:
+    """
+    Extract the export columns from the restaurants, one list per column
+    
+    The same columns feed the console statistics and the exporters, so they
+    are extracted once after deduplication instead of by each consumer.
+    
+    Args:
+        restaurants: List of Restaurant objects
+        
+    Returns:
+        Dict[str, list]: Column name -> values, keyed in COLUMN_ORDER
+    """
+    return {column: list(map(attrgetter(column), restaurants)) for column in COLUMN_ORDER}
+
+
+def export_restaurants_to_excel(all_restaurants: List[Restaurant], custom_name: str = "",
+                                columns: Optional[Dict[str, list]] = None) -> str:
     """
     Export restaurant data to Excel with multiple sheets
     
     Args:
         all_restaurants: List of Restaurant objects to export
         custom_name: Custom name to include in filename
+        columns: Precomputed build_export_columns() result, built here if omitted
         
     Returns:
         str: Generated Excel filename, or empty string if export failed
@@ -602,82 +1112,136 @@ def export_restaurants_to_excel(all_restaurants: List[Restaurant], custom_name:
         print("❌ No data to export")
         return ""
     
-    # Generate filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    if custom_name:
-        filename = f"foodpanda_hk_{custom_name}_{timestamp}.xlsx"
-    else:
-        filename = f"foodpanda_hk_coordinates_{timestamp}.xlsx"
+    filename = get_export_filename(custom_name, 'xlsx')
     
     print(f"💾 Exporting {len(all_restaurants)} restaurant records to {filename}...")
     
-    # Convert to DataFrame
-    restaurant_dicts = [asdict(restaurant) for restaurant in all_restaurants]
-    df = pd.DataFrame(restaurant_dicts)
+    if columns is None:
+        columns = build_export_columns(all_restaurants)
     
-    # Reorder columns for better readability
-    column_order = [
-        'name', 'area', 'code', 'rating', 'rating_count', 'cuisines',
-        'address', 'phone', 'longitude', 'latitude', 'distance',
-        'minimum_order', 'budget_range', 'chain_name', 'legal_name',
-        'is_open', 'is_delivery_enabled', 'is_pickup_enabled',
-        'delivery_provider', 'available_in', 'tags',
-        'hero_image', 'website'
-    ]
+    # Collect all statistics in a single pass over the columns
+    ratings = []
+    area_names = set()
+    coord_count = phone_count = chain_count = 0
+    area_groups = defaultdict(lambda: {'names': 0, 'ratings': [], 'budgets': []})
     
-    # Add missing columns with None values
-    for col in column_order:
-        if col not in df.columns:
-            df[col] = None
+    for name, area, rating, phone, longitude, latitude, budget_range, chain_name in zip(
+            columns['name'], columns['area'], columns['rating'], columns['phone'],
+            columns['longitude'], columns['latitude'], columns['budget_range'], columns['chain_name']):
+        area_names.add(area)
+        if rating is not None:
+            ratings.append(rating)
+        if longitude is not None and latitude is not None:
+            coord_count += 1
+        if phone is not None:
+            phone_count += 1
+        if chain_name is not None:
+            chain_count += 1
+        
+        if area is not None:
+            group = area_groups[area]
+            if name is not None:
+                group['names'] += 1
+            if rating is not None:
+                group['ratings'].append(rating)
+            if budget_range is not None:
+                group['budgets'].append(budget_range)
     
-    df = df[column_order]
+    def rounded_mean(values):
+        return float(np.round(np.mean(values), 2)) if values else None
     
     try:
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        # constant_memory streams each row to disk once the next row starts,
+        # so every sheet must be written strictly row by row; use_zip64 lets
+        # very large crawls exceed the 4GB zip member limit instead of failing on close.
+        # Image/website URLs are written as plain text: hyperlink detection costs a
+        # regex per string cell and Excel drops links beyond 65,530 per worksheet
+        workbook_options = {'constant_memory': True, 'use_zip64': True, 'strings_to_urls': False}
+        with xlsxwriter.Workbook(filename, workbook_options) as workbook:
+            header_format = workbook.add_format({'bold': True, 'border': 1})
+            
             # Main data sheet
-            df.to_excel(writer, sheet_name='Restaurant Data', index=False)
+            write_sheet_rows(workbook, 'Restaurant Data', COLUMN_ORDER,
+                             zip(*(columns[column] for column in COLUMN_ORDER)), header_format)
             
             # Statistics summary sheet
-            total_restaurants = len(all_restaurants)
-            rated_restaurants = df['rating'].notna().sum()
-            avg_rating = round(df['rating'].mean(), 2) if rated_restaurants > 0 else 0
-            unique_areas = len(df['area'].unique())
-            
-            stats_data = {
-                'Statistic': [
-                    'Total Restaurants',
-                    'Restaurants with Ratings',
-                    'Average Rating', 
-                    'Search Coordinate Points',
-                    'Records with GPS Coordinates',
-                    'Records with Phone Numbers',
-                    'Chain Restaurants',
-                    'Data Collection Time'
-                ],
-                'Value': [
-                    total_restaurants,
-                    rated_restaurants,
-                    avg_rating,
-                    unique_areas,
-                    (df['longitude'].notna() & df['latitude'].notna()).sum(),
-                    df['phone'].notna().sum(),
-                    df['chain_name'].notna().sum(),
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                ]
-            }
-            
-            stats_df = pd.DataFrame(stats_data)
-            stats_df.to_excel(writer, sheet_name='Statistics Summary', index=False)
+            stats_rows = [
+                ('Total Restaurants', len(all_restaurants)),
+                ('Restaurants with Ratings', len(ratings)),
+                ('Average Rating', rounded_mean(ratings) or 0),
+                ('Search Coordinate Points', len(area_names)),
+                ('Records with GPS Coordinates', coord_count),
+                ('Records with Phone Numbers', phone_count),
+                ('Chain Restaurants', chain_count),
+                ('Data Collection Time', datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            ]
+            write_sheet_rows(workbook, 'Statistics Summary', ['Statistic', 'Value'], stats_rows, header_format)
             
             # Area-wise statistics sheet
-            if len(df) > 0:
-                area_stats = df.groupby('area').agg({
-                    'name': 'count',
-                    'rating': ['count', 'mean'],
-                    'budget_range': 'mean'
-                }).round(2)
-                area_stats.columns = ['Restaurant Count', 'Rated Count', 'Average Rating', 'Average Budget']
-                area_stats.reset_index().to_excel(writer, sheet_name='Area Statistics', index=False)
+            area_rows = [
+                (area, group['names'], len(group['ratings']),
+                 rounded_mean(group['ratings']), rounded_mean(group['budgets']))
+                for area, group in sorted(area_groups.items())
+            ]
+            write_sheet_rows(workbook, 'Area Statistics',
+                             ['area', 'Restaurant Count', 'Rated Count', 'Average Rating', 'Average Budget'],
+                             area_rows, header_format)
+        
+        print(f"✅ Successfully exported to {filename}")
+        return filename
+        
+    except Exception as e:
+        print(f"❌ Export failed: {e}")
+        return ""
+
+
+def check_parquet_support() -> bool:
+    """
+    Check that pyarrow is available for the Parquet export, reporting it if not
+    
+    Returns:
+        bool: True if Parquet files can be written
+    """
+    if pq is None:
+        print("❌ Parquet export requires pyarrow (pip install pyarrow)")
+        return False
+    return True
+
+
+def export_restaurants_to_parquet(all_restaurants: List[Restaurant], custom_name: str = "",
+                                  columns: Optional[Dict[str, list]] = None) -> str:
+    """
+    Export restaurant data to a single Parquet file
+    
+    Much faster to write and smaller than the Excel workbook; intended for
+    downstream analysis rather than viewing. Requires pyarrow.
+    
+    Args:
+        all_restaurants: List of Restaurant objects to export
+        custom_name: Custom name to include in filename
+        columns: Precomputed build_export_columns() result, built here if omitted
+        
+    Returns:
+        str: Generated Parquet filename, or empty string if export failed
+    """
+    if not all_restaurants:
+        print("❌ No data to export")
+        return ""
+    
+    if not check_parquet_support():
+        return ""
+    
+    filename = get_export_filename(custom_name, 'parquet')
+    
+    print(f"💾 Exporting {len(all_restaurants)} restaurant records to {filename}...")
+    
+    if columns is None:
+        columns = build_export_columns(all_restaurants)
+    
+    try:
+        # Build the table column by column, in the same order as the Excel sheet
+        table = pa.table({column: columns[column] for column in COLUMN_ORDER})
+        pq.write_table(table, filename)
         
         print(f"✅ Successfully exported to {filename}")
         return filename
@@ -687,7 +1251,25 @@ def export_restaurants_to_excel(all_restaurants: List[Restaurant], custom_name:
         return ""
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line options
+    
+    Args:
+        argv: Argument list, defaults to sys.argv[1:]
+        
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="FoodPanda Hong Kong restaurant crawler (coordinate input version)")
+    parser.add_argument('--format', choices=['excel', 'parquet'], default='excel',
+                        help="Output format: multi-sheet Excel workbook (default) or a single Parquet file")
+    parser.add_argument('--fresh', action='store_true',
+                        help=f"Discard checkpoints in {CHECKPOINT_DIR}/ from an interrupted run and crawl everything again")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Main program function - Coordinate Input Version
     
@@ -695,8 +1277,17 @@ def main():
     1. Gets user coordinate selection
     2. Crawls restaurant data from each coordinate point
     3. Removes duplicates
-    4. Exports results to Excel
+    4. Exports results to Excel (or Parquet with --format parquet)
+    
+    Args:
+        argv: Command line arguments, defaults to sys.argv[1:]
     """
+    args = parse_args(argv)
+    
+    # Fail before crawling rather than losing the results at export time
+    if args.format == 'parquet' and not check_parquet_support():
+        return
+    
     print("🇭🇰 FoodPanda Hong Kong Restaurant Crawler")
     print("📐 Coordinate Input Version + Automatic Deduplication")
     print("="*80)
@@ -711,33 +1302,15 @@ def main():
     print(f"📍 Search coordinate points: {len(coordinates)}")
     print(f"⏰ Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-" * 80)
-    # Initialize data collection
-    all_restaurants = []
-    processed_count = 0
     
-    # Process each coordinate point
-    for longitude, latitude, area_name in coordinates:
-        try:
-            processed_count += 1
-            print(f"\n🔄 Progress: {processed_count}/{len(coordinates)} - {area_name}")
-            
-            # Fetch restaurants from this location
-            area_restaurants = get_restaurants_by_location(longitude, latitude, area_name, limit=150)
-            
-            if area_restaurants:
-                all_restaurants.extend(area_restaurants)
-                print(f"📊 Current total: {len(all_restaurants)} restaurants (this batch: {len(area_restaurants)})")
-            
-            # Dynamic rest intervals to avoid rate limiting
-            if processed_count % 5 == 0:
-                print("⏸️  Resting 3 seconds after processing 5 coordinate points...")
-                time.sleep(3)
-            else:
-                time.sleep(1.5)
-            
-        except Exception as e:
-            print(f"❌ Error occurred for {area_name}: {e}")
-            continue
+    # Checkpoints left by an interrupted run are reused unless asked otherwise
+    if args.fresh:
+        clear_checkpoints()
+    elif os.path.isdir(CHECKPOINT_DIR) and os.listdir(CHECKPOINT_DIR):
+        print(f"♻️  Resuming from checkpoints in {CHECKPOINT_DIR}/ (run with --fresh to start over)")
+    
+    # Fetch all coordinate points concurrently
+    all_restaurants = crawl_coordinates(coordinates, limit=150)
     
     # Display collection results
     print(f"\n📊 Raw collection results:")
@@ -748,27 +1321,49 @@ def main():
         # Remove duplicates
         unique_restaurants = remove_duplicates(all_restaurants)
         
-        # Calculate detailed statistics
-        rated_count = sum(1 for r in unique_restaurants if r.rating is not None)
-        coord_count = sum(1 for r in unique_restaurants if r.longitude and r.latitude)
+        # Extract the columns once; the statistics and the export share them
+        columns = build_export_columns(unique_restaurants)
+        
+        # Calculate detailed statistics in a single pass
+        ratings = []
+        coord_count = 0
+        for rating, longitude, latitude in zip(columns['rating'], columns['longitude'], columns['latitude']):
+            if rating is not None:
+                ratings.append(rating)
+            if longitude is not None and latitude is not None:
+                coord_count += 1
+        
+        unique_count = len(unique_restaurants)
+        percent_factor = 100.0 / unique_count if unique_count else 0.0
         
         print(f"\n🎯 Final statistics:")
-        print(f"• Deduplicated restaurants: {len(unique_restaurants)}")
+        print(f"• Deduplicated restaurants: {unique_count}")
         
+        rated_count = len(ratings)
         if rated_count > 0:
-            avg_rating = sum(r.rating for r in unique_restaurants if r.rating is not None) / rated_count
-            print(f"• With ratings: {rated_count} ({rated_count/len(unique_restaurants)*100:.1f}%)")
+            avg_rating = math.fsum(ratings) / rated_count
+            print(f"• With ratings: {rated_count} ({rated_count * percent_factor:.1f}%)")
             print(f"• Average rating: {avg_rating:.2f}")
         
-        print(f"• With coordinates: {coord_count} ({coord_count/len(unique_restaurants)*100:.1f}%)")
+        print(f"• With coordinates: {coord_count} ({coord_count * percent_factor:.1f}%)")
         
-        # Export to Excel
-        excel_file = export_restaurants_to_excel(unique_restaurants, "coordinates")
+        if args.format == 'parquet':
+            # Export to Parquet
+            output_file = export_restaurants_to_parquet(unique_restaurants, "coordinates", columns)
+        else:
+            # Export to Excel
+            output_file = export_restaurants_to_excel(unique_restaurants, "coordinates", columns)
         
-        if excel_file:
+        if output_file:
+            # Results are safely exported, the next run should crawl fresh data
+            clear_checkpoints()
+            
             print(f"\n🎉 Search completed!")
-            print(f"📄 Excel file: {excel_file}")
-            print(f"📊 Contains sheets: Restaurant Data, Statistics Summary, Area Statistics")
+            if args.format == 'parquet':
+                print(f"📄 Parquet file: {output_file}")
+            else:
+                print(f"📄 Excel file: {output_file}")
+                print(f"📊 Contains sheets: Restaurant Data, Statistics Summary, Area Statistics")
         
     else:
         print("❌ No restaurant data was collected")